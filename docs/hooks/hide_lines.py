@@ -12,34 +12,54 @@ from typing import Any
 import mkdocs.plugins
 from pymdownx import highlight  # type: ignore
 
+HIDDEN_MARKER = "#! hidden"
+CHAINMOCK_REPR_PREFIX = "<chainmock"
+REMOVE_PREFIX_MARKER = "#! remove-prefix"
+# Doctest prompt prefixes and the number of characters to strip from each
+PROMPT_PREFIXES = {">>> ": 4, "... ": 4, ">>>": 3, "...": 3}
+
 
 @mkdocs.plugins.event_priority(0)
 # pylint: disable=unused-argument
 def on_startup(command: str, dirty: bool) -> None:
     """Monkey patch Highlight extension to hide lines in code blocks."""
     original = highlight.Highlight.highlight
+    if getattr(original, "_chainmock_patched", False):
+        # Do not wrap the highlighter again if the hook is run more than once
+        return
+    join = "".join
 
     def patched(self: Any, src: str, *args: Any, **kwargs: Any) -> Any:
-        src = "".join(
-            line for line in src.splitlines(keepends=True) if not line.strip().endswith("#! hidden")
-        )
-        src = "".join(
-            line for line in src.splitlines(keepends=True) if not (line.strip().startswith("<chainmock") and line.strip().endswith(">"))
+        if (
+            HIDDEN_MARKER not in src
+            and CHAINMOCK_REPR_PREFIX not in src
+            and not src.startswith(REMOVE_PREFIX_MARKER)
+        ):
+            # Most code blocks have nothing to hide
+            return original(self, src, *args, **kwargs)
+        src = join(
+            line
+            for line in src.splitlines(keepends=True)
+            if not (stripped := line.strip()).endswith(HIDDEN_MARKER)
+            and not (stripped.startswith(CHAINMOCK_REPR_PREFIX) and stripped.endswith(">"))
         )
-        if src.startswith("#! remove-prefix"):
-            new_src = ""
+        if src.startswith(REMOVE_PREFIX_MARKER):
+            lines: list[str] = []
             for line in src.splitlines():
-                if line.startswith("#! remove-prefix"):
+                head = line[:4]
+                prefix_length = PROMPT_PREFIXES.get(head) or PROMPT_PREFIXES.get(head[:3])
+                if line.startswith(REMOVE_PREFIX_MARKER):
                     continue
-                elif line.startswith(">>> ") or line.startswith("... "):
-                    new_src += line[4:] + "\n"
-                elif line.startswith(">>>") or line.startswith("..."):
-                    new_src += line[3:] + "\n"
+                elif prefix_length:
+                    lines.append(line[prefix_length:])
                 elif line.startswith("Traceback (most recent call last):"):
-                    new_src += f"|\n{line}\n"
+                    lines.append("|")
+                    lines.append(line)
                 else:
-                    new_src += line + "\n"
+                    lines.append(line)
+            new_src = "\n".join(lines) + "\n" if lines else ""
             return original(self, new_src, *args, **kwargs)
         return original(self, src, *args, **kwargs)
 
+    patched._chainmock_patched = True  # type: ignore[attr-defined]
     highlight.Highlight.highlight = patched
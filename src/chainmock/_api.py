@@ -6,6 +6,7 @@ from __future__ import annotations
 import functools
 import inspect
 import itertools
+import operator
 import sys
 from collections.abc import Callable, Sequence
 from typing import Any, Literal, Optional, TypeVar, Union
@@ -19,8 +20,18 @@ else:
 
 AnyMock = Union[umock.AsyncMock, umock.MagicMock, umock.PropertyMock]
 AsyncAndSyncMock = Union[umock.AsyncMock, umock.MagicMock]
-
-_DEFAULT_CLASS_ATTRIBUTES = dir(type("dummy", (object,), {}))
+# Assertion function with the positional and keyword arguments to call it with. Keyword
+# arguments are None if the assertion takes none to avoid allocating an empty dict.
+DeferredAssertion = tuple[Callable[..., None], tuple[Any, ...], Optional[dict[str, Any]]]
+
+_COUNT_COMPARATORS: dict[Optional[str], Callable[[int, int], bool]] = {
+    None: operator.eq,
+    "at least": operator.ge,
+    "at most": operator.le,
+}
+# Words used for call and await counts in assertion messages, indexed by count
+_COUNT_WORDS = ("0 times", "once", "twice")
+_DEFAULT_CLASS_ATTRIBUTES = frozenset(dir(type("dummy", (object,), {})))
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -53,6 +64,16 @@ class Assert:
     Assert should not be initialized directly. Use mocker function instead.
     """
 
+    __slots__ = (
+        "__parent",
+        "_attr_mock",
+        "__non_callable",
+        "__assertions",
+        "__patch",
+        "_kind",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         parent: Mock,
@@ -68,7 +89,9 @@ class Assert:
             )
         self.__parent = parent
         self._attr_mock = attr_mock
-        self.__assertions: list[Callable[..., None]] = []
+        # Mocks with a spec resolve isinstance through their __class__ so only check once
+        self.__non_callable = isinstance(attr_mock, umock.NonCallableMagicMock)
+        self.__assertions: Optional[list[DeferredAssertion]] = None
         self.__patch = patch
         self._kind = kind
 
@@ -138,7 +161,7 @@ class Assert:
             raise AttributeError(
                 "'return_value' method is not supported when spying. Use it with mocking instead."
             )
-        if isinstance(self._attr_mock, umock.NonCallableMagicMock) and self.__patch is not None:
+        if self.__non_callable and self.__patch is not None:
             # Support mocking module attributes/variables and instance attributes
             self.__patch.stop()
             self.__patch.new = value
@@ -231,9 +254,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._attr_mock.assert_called_with, *args, **kwargs)
-        )
+        self.__add_assertion(self._attr_mock.assert_called_with, args, kwargs)
         return self
 
     @only_async
@@ -258,9 +279,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._attr_mock.assert_awaited_with, *args, **kwargs)
-        )
+        self.__add_assertion(self._attr_mock.assert_awaited_with, args, kwargs)
         return self
 
     def match_args_last_call(self, *args: Any, **kwargs: Any) -> Assert:
@@ -296,9 +315,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._assert_match_call_args, "last", *args, **kwargs)
-        )
+        self.__add_assertion(self._assert_match_call_args, ("last", *args), kwargs)
         return self
 
     @only_async
@@ -335,9 +352,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._assert_match_await_args, "last", *args, **kwargs)
-        )
+        self.__add_assertion(self._assert_match_await_args, ("last", *args), kwargs)
         return self
 
     def called_once_with(self, *args: Any, **kwargs: Any) -> Assert:
@@ -362,9 +377,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._attr_mock.assert_called_once_with, *args, **kwargs)
-        )
+        self.__add_assertion(self._attr_mock.assert_called_once_with, args, kwargs)
         return self
 
     @only_async
@@ -390,9 +403,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._attr_mock.assert_awaited_once_with, *args, **kwargs)
-        )
+        self.__add_assertion(self._attr_mock.assert_awaited_once_with, args, kwargs)
         return self
 
     def any_call_with(self, *args: Any, **kwargs: Any) -> Assert:
@@ -420,9 +431,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._attr_mock.assert_any_call, *args, **kwargs)
-        )
+        self.__add_assertion(self._attr_mock.assert_any_call, args, kwargs)
         return self
 
     @only_async
@@ -451,9 +460,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._attr_mock.assert_any_await, *args, **kwargs)
-        )
+        self.__add_assertion(self._attr_mock.assert_any_await, args, kwargs)
         return self
 
     def all_calls_with(self, *args: Any, **kwargs: Any) -> Assert:
@@ -475,7 +482,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._assert_all_calls_with, *args, **kwargs))
+        self.__add_assertion(self._assert_all_calls_with, args, kwargs)
         return self
 
     @only_async
@@ -498,7 +505,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._assert_all_awaits_with, *args, **kwargs))
+        self.__add_assertion(self._assert_all_awaits_with, args, kwargs)
         return self
 
     def match_args_any_call(self, *args: Any, **kwargs: Any) -> Assert:
@@ -533,9 +540,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._assert_match_call_args, "any", *args, **kwargs)
-        )
+        self.__add_assertion(self._assert_match_call_args, ("any", *args), kwargs)
         return self
 
     @only_async
@@ -571,9 +576,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._assert_match_await_args, "any", *args, **kwargs)
-        )
+        self.__add_assertion(self._assert_match_await_args, ("any", *args), kwargs)
         return self
 
     def match_args_all_calls(self, *args: Any, **kwargs: Any) -> Assert:
@@ -614,9 +617,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._assert_match_call_args, "all", *args, **kwargs)
-        )
+        self.__add_assertion(self._assert_match_call_args, ("all", *args), kwargs)
         return self
 
     @only_async
@@ -658,9 +659,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._assert_match_await_args, "all", *args, **kwargs)
-        )
+        self.__add_assertion(self._assert_match_await_args, ("all", *args), kwargs)
         return self
 
     def has_calls(self, calls: Sequence[umock._Call], any_order: bool = False) -> Assert:
@@ -693,9 +692,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._attr_mock.assert_has_calls, calls, any_order)
-        )
+        self.__add_assertion(self._attr_mock.assert_has_calls, (calls, any_order))
         return self
 
     @only_async
@@ -729,9 +726,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._attr_mock.assert_has_awaits, calls, any_order)
-        )
+        self.__add_assertion(self._attr_mock.assert_has_awaits, (calls, any_order))
         return self
 
     def not_called(self) -> Assert:
@@ -750,7 +745,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._attr_mock.assert_not_called))
+        self.__add_assertion(self._attr_mock.assert_not_called)
         return self
 
     @only_async
@@ -770,7 +765,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._attr_mock.assert_not_awaited))
+        self.__add_assertion(self._attr_mock.assert_not_awaited)
         return self
 
     def called(self) -> Assert:
@@ -790,7 +785,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._attr_mock.assert_called))
+        self.__add_assertion(self._attr_mock.assert_called)
         return self
 
     @only_async
@@ -811,7 +806,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._attr_mock.assert_awaited))
+        self.__add_assertion(self._attr_mock.assert_awaited)
         return self
 
     def called_once(self) -> Assert:
@@ -831,7 +826,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._assert_call_count, 1))
+        self.__add_assertion(self._assert_call_count, (1,))
         return self
 
     @only_async
@@ -852,7 +847,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._assert_await_count, 1))
+        self.__add_assertion(self._assert_await_count, (1,))
         return self
 
     def called_twice(self) -> Assert:
@@ -867,7 +862,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._assert_call_count, 2))
+        self.__add_assertion(self._assert_call_count, (2,))
         return self
 
     @only_async
@@ -883,7 +878,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._assert_await_count, 2))
+        self.__add_assertion(self._assert_await_count, (2,))
         return self
 
     def call_count(self, call_count: int) -> Assert:
@@ -902,7 +897,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._assert_call_count, call_count))
+        self.__add_assertion(self._assert_call_count, (call_count,))
         return self
 
     @only_async
@@ -922,7 +917,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._assert_await_count, await_count))
+        self.__add_assertion(self._assert_await_count, (await_count,))
         return self
 
     def call_count_at_least(self, call_count: int) -> Assert:
@@ -950,7 +945,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._assert_call_count, call_count, "at least"))
+        self.__add_assertion(self._assert_call_count, (call_count, "at least"))
         return self
 
     @only_async
@@ -979,9 +974,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._assert_await_count, await_count, "at least")
-        )
+        self.__add_assertion(self._assert_await_count, (await_count, "at least"))
         return self
 
     def call_count_at_most(self, call_count: int) -> Assert:
@@ -1009,7 +1002,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(functools.partial(self._assert_call_count, call_count, "at most"))
+        self.__add_assertion(self._assert_call_count, (call_count, "at most"))
         return self
 
     @only_async
@@ -1038,9 +1031,7 @@ class Assert:
         Returns:
             Assert instance so that calls can be chained.
         """
-        self.__assertions.append(
-            functools.partial(self._assert_await_count, await_count, "at most")
-        )
+        self.__add_assertion(self._assert_await_count, (await_count, "at most"))
         return self
 
     def self(self) -> Mock:
@@ -1075,18 +1066,15 @@ class Assert:
     def _assert_call_count(
         self, call_count: int, modifier: Optional[Literal["at least", "at most"]] = None
     ) -> None:
-        if modifier is None and self._attr_mock.call_count == call_count:
-            return
-        if modifier == "at least" and self._attr_mock.call_count >= call_count:
-            return
-        if modifier == "at most" and self._attr_mock.call_count <= call_count:
+        actual_count = self._attr_mock.call_count
+        if _COUNT_COMPARATORS[modifier](actual_count, call_count):
             return
         modifier_str = f"{modifier} " if modifier else ""
         name = self._attr_mock._mock_name or "mock"  # pylint:disable=protected-access
         msg = (
             f"Expected '{name}' to have been called {modifier_str}"  # pylint:disable=protected-access
             f"{self._format_call_count(call_count)}. "
-            f"Called {self._format_call_count(self._attr_mock.call_count)}."
+            f"Called {self._format_call_count(actual_count)}."
             f"{self._attr_mock._calls_repr()}"
         )
         raise AssertionError(msg)
@@ -1094,18 +1082,15 @@ class Assert:
     def _assert_await_count(
         self, await_count: int, modifier: Optional[Literal["at least", "at most"]] = None
     ) -> None:
-        if modifier is None and self._attr_mock.await_count == await_count:
-            return
-        if modifier == "at least" and self._attr_mock.await_count >= await_count:
-            return
-        if modifier == "at most" and self._attr_mock.await_count <= await_count:
+        actual_count = self._attr_mock.await_count
+        if _COUNT_COMPARATORS[modifier](actual_count, await_count):
             return
         modifier_str = f"{modifier} " if modifier else ""
         name = self._attr_mock._mock_name or "mock"  # pylint:disable=protected-access
         msg = (
             f"Expected '{name}' to have been awaited {modifier_str}"
             f"{self._format_call_count(await_count)}. "
-            f"Awaited {self._format_call_count(self._attr_mock.await_count)}."
+            f"Awaited {self._format_call_count(actual_count)}."
             f"{self._awaits_repr()}"
         )
         raise AssertionError(msg)
@@ -1220,16 +1205,30 @@ class Assert:
 
     @staticmethod
     def _format_call_count(call_count: int) -> str:
-        if call_count == 1:
-            return "once"
-        if call_count == 2:
-            return "twice"
+        if 0 <= call_count < len(_COUNT_WORDS):
+            return _COUNT_WORDS[call_count]
         return f"{call_count} times"
 
+    def __add_assertion(
+        self,
+        assertion: Callable[..., None],
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+    ) -> None:
+        # Most mocks only set a return value so allocate the list on first use
+        if self.__assertions is None:
+            self.__assertions = []
+        self.__assertions.append((assertion, args, kwargs))
+
     def _validate(self) -> None:
-        while len(self.__assertions) > 0:
-            assertion = self.__assertions.pop()
-            assertion()
+        if not self.__assertions:
+            return
+        for assertion, args, kwargs in self.__assertions:
+            if kwargs is None:
+                assertion(*args)
+            else:
+                assertion(*args, **kwargs)
+        self.__assertions.clear()
 
 
 class State:
@@ -1238,6 +1237,9 @@ class State:
     Used internally by chainmock to tear down mocks.
     """
 
+    # Mocks are keyed by the id of their target. The mocks must be held strongly so that they
+    # can be reset and validated even if the test does not keep a reference to them. Each mock
+    # also references its target which keeps the ids unique until the state is reset.
     MOCKS: dict[Union[int, str], Mock] = {}
 
     @classmethod
@@ -1250,20 +1252,14 @@ class State:
     ) -> Mock:
         """Get existing mock or create a new one if the object has not been mocked yet."""
         if target is None:  # Do not cache stubs
-            Stub = type("Stub", (Mock,), {})  # Use intermediary class to attach properties
-            stub = Stub(target, spec=spec, _internal=True)
+            stub = Mock._create_stub(spec=spec)  # pylint: disable=protected-access
             cls.MOCKS[id(stub)] = stub
-            return stub  # type: ignore[no-any-return]
-        key: Union[int, str]
-        if isinstance(target, str):
-            key = target
-        else:
-            key = id(target)
+            return stub
+        is_patch = isinstance(target, str)
+        key: Union[int, str] = target if is_patch else id(target)
         mock = cls.MOCKS.get(key)
         if mock is None:
-            patch = None
-            if isinstance(target, str):
-                patch = umock.patch(target, spec=True)
+            patch = umock.patch(target, spec=True) if is_patch else None
             mock = Mock(target, patch=patch, spec=spec, patch_class=patch_class, _internal=True)
             cls.MOCKS[key] = mock
         return mock
@@ -1294,12 +1290,27 @@ class State:
         cls.validate_mocks()
 
 
-class Mock:
+class Mock:  # pylint: disable=too-many-instance-attributes
     """Mock allows mocking and spying mocked and patched objects.
 
     Mock should not be initialized directly. Use mocker function instead.
     """
 
+    # Stubs are created from a subclass without slots so that mocked attributes can be set on them
+    __slots__ = (
+        "__target",
+        "__target_is_class",
+        "__target_is_module",
+        "__spec_class",
+        "__patch",
+        "__mock",
+        "__assertions",
+        "__object_patches",
+        "__patch_class",
+        "__patch_target_is_class",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         target: Optional[Any] = None,
@@ -1316,6 +1327,9 @@ class Mock:
                 "Mock should not be initialized directly. Use mocker function instead."
             )
         self.__target = target
+        # The target never changes so it only needs to be inspected once
+        self.__target_is_class = inspect.isclass(target)
+        self.__target_is_module = inspect.ismodule(target)
         self.__spec_class: Optional[type[Any]] = None
         # Set __spec_class if spec is a class or an instance of a class.
         if spec is not None and type(spec) not in (list, tuple):
@@ -1329,10 +1343,19 @@ class Mock:
             patch.start() if patch else umock.MagicMock(spec=spec if spec is not None else target)
         )
         self.__assertions: dict[str, Assert] = {}
-        self.__object_patches: list[umock._patch[Any]] = (  # pylint: disable=unsubscriptable-object
-            []
-        )
+        # Stubs and patched objects never patch attributes so allocate the list on first use
+        self.__object_patches: Optional[
+            list[umock._patch[Any]]  # pylint: disable=unsubscriptable-object
+        ] = None
         self.__patch_class: bool = patch_class
+        # Patched original is only available after the patch has been started
+        self.__patch_target_is_class = patch is not None and inspect.isclass(patch.temp_original)
+
+    @staticmethod
+    def _create_stub(spec: Optional[Any] = None) -> Mock:
+        """Create a new stub without a target."""
+        Stub = type("Stub", (Mock,), {})  # Use intermediary class to attach properties
+        return Stub(spec=spec, _internal=True)  # type: ignore[no-any-return]
 
     def __call__(self, *args: Any, **kwargs: Any) -> Mock:
         """Return self when Mock is called directly.
@@ -1426,42 +1449,38 @@ class Mock:
             raise RuntimeError(f"'{name}' is not callable. Only callable objects can be spied.")
         attr_mock = umock.MagicMock(name=self.__format_mock_name(name))
         parameters = tuple(inspect.signature(original).parameters.keys())
-        is_class_method = self.__get_method_type(parsed_name, classmethod)
-        is_static_method = self.__get_method_type(parsed_name, staticmethod)
+        static_attr = self.__get_static_attribute(parsed_name)
+        is_descriptor = isinstance(static_attr, (classmethod, staticmethod))
+        has_self = bool(parameters) and parameters[0] == "self"
+        parameter_count = len(parameters)
 
         def pass_through(*args: Any, **kwargs: Any) -> Any:
-            has_self = len(parameters) > 0 and parameters[0] == "self"
-            skip_first = len(args) > len(parameters) and (is_class_method or is_static_method)
-            mock_args = list(args)
+            skip_first = is_descriptor and len(args) > parameter_count
             if has_self or skip_first:
-                mock_args = mock_args[1:]
-            attr_mock(*mock_args, **kwargs)
+                attr_mock(*args[1:], **kwargs)
+            else:
+                attr_mock(*args, **kwargs)
             if skip_first:
-                args = tuple(list(args)[1:])
+                return original(*args[1:], **kwargs)
             return original(*args, **kwargs)
 
-        patch = umock.patch.object(self.__target, parsed_name, new=pass_through)
-        patch.start()
-        self.__object_patches.append(patch)
+        self.__start_object_patch(umock.patch.object(self.__target, parsed_name, new=pass_through))
         assertion = Assert(self, attr_mock, kind="spy", _internal=True)
         self.__assertions[name] = assertion
         return assertion
 
-    def __get_method_type(
-        self,
-        name: str,
-        method_type: Union[type[classmethod], type[staticmethod]],  # type: ignore[type-arg]
-    ) -> bool:
+    def __get_static_attribute(self, name: str) -> Optional[Any]:
+        """Get the attribute without triggering the descriptor protocol."""
         try:
-            return isinstance(inspect.getattr_static(self.__target, name), method_type)
+            return inspect.getattr_static(self.__target, name)
         except AttributeError:
             # Inspecting proxied objects raises AttributeError
             if hasattr(self.__target, "__mro__"):
                 for cls in inspect.getmro(self.__target):  # type: ignore[arg-type]
                     method = vars(cls).get(name)
                     if method is not None:
-                        return isinstance(method, method_type)
-            return False
+                        return method
+            return None
 
     def mock(
         self,
@@ -1537,15 +1556,15 @@ class Mock:
                     f"Attribute '{name}' has already been spied. Can't mock a spied attribute."
                 )
             return cached
-        parts = name.split(".")
-        parsed_name = self.__remove_name_mangling(parts[0])
-        parts = parts[1:]
+        attr_name, separator, chained_name = name.partition(".")
+        parsed_name = self.__remove_name_mangling(attr_name)
+        chained = chained_name if separator else None
         if not parsed_name:
             raise ValueError("Attribute name cannot be empty.")
         if self.__target is None:
             assertion = self.__stub_attribute(
                 parsed_name,
-                parts,
+                chained,
                 create=create,
                 force_property=force_property,
                 force_async=force_async,
@@ -1553,7 +1572,7 @@ class Mock:
         elif self.__patch is not None:
             assertion = self.__patch_attribute(
                 parsed_name,
-                parts,
+                chained,
                 create=create,
                 force_property=force_property,
                 force_async=force_async,
@@ -1562,22 +1581,25 @@ class Mock:
             original = self.__get_original(parsed_name, create)
             assertion = self.__mock_attribute(
                 parsed_name,
-                parts,
+                chained,
                 original,
                 create=create,
                 force_property=force_property,
                 force_async=force_async,
             )
-        assertion.return_value(None)
+        # Chained names set the return value of the last attribute when it is mocked. Non-callable
+        # attributes are already patched with None.
+        if chained is None and not isinstance(assertion.get_mock(), umock.NonCallableMagicMock):
+            assertion.return_value(None)
         self.__assertions[name] = assertion
         return assertion
 
     def __remove_name_mangling(self, name: str) -> str:
         """Get the real method name if it uses name mangling."""
-        if inspect.ismodule(self.__target) or name.endswith("__") or not name.startswith("__"):
+        if self.__target_is_module or name.endswith("__") or not name.startswith("__"):
             return name
-        if inspect.isclass(self.__target):
-            class_name = self.__target.__name__
+        if self.__target_is_class:
+            class_name = self.__target.__name__  # type: ignore[union-attr]
         else:
             # Get class name from an instance
             class_name = self.__target.__class__.__name__
@@ -1592,27 +1614,30 @@ class Mock:
             raise
 
     def __stub_attribute(
-        self, name: str, parts: list[str], *, create: bool, force_property: bool, force_async: bool
+        self,
+        name: str,
+        chained: Optional[str],
+        *,
+        create: bool,
+        force_property: bool,
+        force_async: bool,
     ) -> Assert:
-        if name in list(set(dir(Mock)) - set(dir(type))):
+        if name in _MOCK_INTERNAL_ATTRIBUTES:
             raise ValueError(f"Cannot replace Mock internal attribute {name}")
         attr_mock = self.__get_stub_attr_mock(
             name,
             create=create,
-            force_property=force_property if not parts else False,
-            force_async=force_async if not parts else False,
+            force_property=force_property if chained is None else False,
+            force_async=force_async if chained is None else False,
         )
         attr_mock._mock_name = f"Stub.{name}"  # pylint: disable=protected-access
-        assertion = Assert(self, attr_mock, _internal=True)
-        if len(parts) > 0:
-            # Support for chaining methods
-            assertion.return_value(self)
-            assertion = self.mock(
-                ".".join(parts),
-                force_property=force_property,
-                force_async=force_async,
-            )
-        return assertion
+        return self.__create_assertion(
+            attr_mock,
+            chained,
+            force_property=force_property,
+            force_async=force_async,
+            chain_target=self,
+        )
 
     def __get_stub_attr_mock(
         self, name: str, *, create: bool, force_property: bool, force_async: bool
@@ -1645,15 +1670,21 @@ class Mock:
         return attr_mock
 
     def __patch_attribute(
-        self, name: str, parts: list[str], *, create: bool, force_property: bool, force_async: bool
+        self,
+        name: str,
+        chained: Optional[str],
+        *,
+        create: bool,
+        force_property: bool,
+        force_async: bool,
     ) -> Assert:
-        if not self.__patch_class and self.__patch and inspect.isclass(self.__patch.temp_original):
+        if not self.__patch_class and self.__patch_target_is_class:
             attr_mock: AnyMock = self.__get_patch_attr_mock(
                 self.__mock(),
                 name,
                 create=create,
-                force_property=force_property if not parts else False,
-                force_async=force_async if not parts else False,
+                force_property=force_property if chained is None else False,
+                force_async=force_async if chained is None else False,
             )
         else:
             attr_mock = self.__get_patch_attr_mock(
@@ -1661,20 +1692,11 @@ class Mock:
                 name,
                 create=create,
                 force_property=False,
-                force_async=force_async if not parts else False,
-            )
-        assertion = Assert(self, attr_mock, _internal=True)
-        if len(parts) > 0:
-            # Support for chaining methods
-            Stub = type("Stub", (Mock,), {})  # Use intermediary class to attach properties
-            stub = Stub(_internal=True)
-            assertion.return_value(stub)
-            assertion = stub.mock(
-                ".".join(parts),
-                force_property=force_property,
-                force_async=force_async,
+                force_async=force_async if chained is None else False,
             )
-        return assertion
+        return self.__create_assertion(
+            attr_mock, chained, force_property=force_property, force_async=force_async
+        )
 
     def __get_patch_attr_mock(
         self, mock: AnyMock, name: str, *, create: bool, force_property: bool, force_async: bool
@@ -1709,7 +1731,7 @@ class Mock:
     def __mock_attribute(
         self,
         name: str,
-        parts: list[str],
+        chained: Optional[str],
         original: Optional[Any],
         *,
         create: bool,
@@ -1717,24 +1739,21 @@ class Mock:
         force_async: bool,
     ) -> Assert:
         patch: umock._patch[Any]  # pylint: disable=unsubscriptable-object
-        if (inspect.ismodule(self.__target) or self.__is_class_instance()) and (
-            original is not None and not callable(original)
-        ):
+        if not self.__target_is_class and original is not None and not callable(original):
             # Support mocking module attributes/variables and instance attributes
             patch = umock.patch.object(self.__target, name, new=None, create=create)
-            patch.start()
-            self.__object_patches.append(patch)
+            self.__start_object_patch(patch)
             attr_mock = umock.NonCallableMagicMock()
         else:
             new_callable = None
             if (
-                not parts
+                chained is None
                 and force_property
                 or (original is not None and isinstance(original, property))
                 or self.__is_class_attribute(name, original)
             ):
                 new_callable = umock.PropertyMock
-            elif not parts and force_async:
+            elif chained is None and force_async:
                 new_callable = umock.AsyncMock
             patch = umock.patch.object(
                 self.__target,
@@ -1743,64 +1762,85 @@ class Mock:
                 create=create,
                 name=self.__format_mock_name(name),
             )
-            attr_mock = patch.start()
-            self.__object_patches.append(patch)
-        assertion = Assert(self, attr_mock, patch=patch, _internal=True)
-        if len(parts) > 0:
-            # Support for chaining methods
-            Stub = type("Stub", (Mock,), {})  # Use intermediary class to attach properties
-            stub = Stub(_internal=True)
-            assertion.return_value(stub)
-            assertion = stub.mock(
-                ".".join(parts),
-                force_property=force_property,
-                force_async=force_async,
-            )
-        return assertion
+            attr_mock = self.__start_object_patch(patch)
+        return self.__create_assertion(
+            attr_mock,
+            chained,
+            force_property=force_property,
+            force_async=force_async,
+            patch=patch,
+        )
 
-    def __is_class_instance(self) -> bool:
-        return not inspect.isclass(self.__target) and hasattr(self.__target, "__class__")
+    def __create_assertion(
+        self,
+        attr_mock: AnyMock,
+        chained: Optional[str],
+        *,
+        force_property: bool,
+        force_async: bool,
+        patch: Optional[umock._patch[Any]] = None,  # pylint: disable=unsubscriptable-object
+        chain_target: Optional[Mock] = None,
+    ) -> Assert:
+        """Create an assertion for the mocked attribute.
+
+        If the attribute name is chained, the mocked attribute returns the chain target (a
+        new stub by default) and the rest of the name is mocked on it.
+        """
+        assertion = Assert(self, attr_mock, patch=patch, _internal=True)
+        if chained is None:
+            return assertion
+        # Support for chaining methods
+        if chain_target is None:
+            chain_target = self._create_stub()
+        assertion.return_value(chain_target)
+        return chain_target.mock(chained, force_property=force_property, force_async=force_async)
 
     def __is_class_attribute(
         self,
         name: str,
         original: Optional[Any],
     ) -> bool:
-        if callable(original) or not inspect.isclass(self.__target):
+        if callable(original) or not self.__target_is_class or name in _DEFAULT_CLASS_ATTRIBUTES:
             return False
-        class_attributes = (
-            attr[0]
-            for attr in inspect.getmembers(self.__target)
-            if attr[0] not in _DEFAULT_CLASS_ATTRIBUTES
-        )
-        return name in class_attributes
+        # dir() would miss DynamicClassAttributes of the base classes, like Enum's name and value
+        return any(member[0] == name for member in inspect.getmembers(self.__target))
 
     def __format_mock_name(self, name: str) -> str:
         assert self.__target is not None
         target = self.__target
-        if (
-            not inspect.isclass(target)
-            and not inspect.ismodule(target)
-            and hasattr(target, "__class__")
-        ):
+        if not self.__target_is_class and not self.__target_is_module:
             target = target.__class__
         if hasattr(target, "__name__"):
             return f"{target.__name__}.{name}"
         return name  # pragma: no cover
 
+    def __start_object_patch(
+        self, patch: umock._patch[Any]  # pylint: disable=unsubscriptable-object
+    ) -> Any:
+        started = patch.start()
+        if self.__object_patches is None:
+            self.__object_patches = []
+        self.__object_patches.append(patch)
+        return started
+
     def _reset(self) -> None:
-        while len(self.__object_patches) > 0:
-            patch = self.__object_patches.pop()
-            patch.stop()
+        if self.__object_patches:
+            for patch in reversed(self.__object_patches):
+                patch.stop()
+            self.__object_patches.clear()
         if self.__patch is not None:
             self.__patch.stop()
 
     def _validate(self) -> None:
-        for key in list(self.__assertions):
-            assertion = self.__assertions.pop(key)
+        assertions = self.__assertions
+        self.__assertions = {}
+        for assertion in assertions.values():
             assertion._validate()  # pylint: disable=protected-access
 
 
+_MOCK_INTERNAL_ATTRIBUTES = frozenset(dir(Mock)) - frozenset(dir(type))
+
+
 def mocker(
     target: Optional[Union[str, Any]] = None,
     *,
@@ -1930,6 +1970,8 @@ def mocker(
         Mock instance.
     """
     mock = State.get_or_create_mock(target, spec=spec, patch_class=patch_class)
+    if not kwargs:
+        return mock
     for name, value in kwargs.items():
         mock.mock(name, force_property=True).return_value(value)
     return mock
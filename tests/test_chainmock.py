@@ -1,6 +1,7 @@
 """Test common functionality in Chainmock."""
 
 # pylint: disable=missing-docstring
+import weakref
 from unittest import mock as umock
 
 from chainmock._api import Assert, Mock, State, mocker
@@ -26,6 +27,16 @@ class ChainmockTestCase:
             mock = mocker()
             Assert(mock, umock.MagicMock())
 
+    def test_mock_and_assert_support_weak_references(self) -> None:
+        class FooClass:
+            def method(self) -> None:
+                pass
+
+        mock = mocker(FooClass)
+        assertion = mock.mock("method")
+        assert weakref.ref(mock)() is mock
+        assert weakref.ref(assertion)() is assertion
+
     def test_mocker_should_cache_mocks(self) -> None:
         class FooClass:
             pass
@@ -2,6 +2,7 @@
 
 # pylint: disable=missing-docstring,too-many-lines
 import builtins
+import enum
 import re
 import sys
 from typing import Any
@@ -722,6 +723,18 @@ class MockingTestCase:
         ):
             State.teardown()
 
+    def test_mock_assertions_validated_in_order(self) -> None:
+        class FooClass:
+            def method(self) -> None:
+                pass
+
+        mocker(FooClass).mock("method").called_once().called_twice()
+        with assert_raises(
+            AssertionError,
+            "Expected 'FooClass.method' to have been called once. Called 0 times.",
+        ):
+            State.teardown()
+
     def test_mock_instance_method_call_count_at_least(self) -> None:
         class FooClass:
             def method(self) -> None:
@@ -1051,3 +1064,11 @@ class MockingTestCase:
         assert SomeClass.ATTR == "mocked"
         State.teardown()
         assert SomeClass.ATTR == "class_attr"
+
+    def test_mock_enum_dynamic_class_attribute(self) -> None:
+        class Color(enum.Enum):
+            RED = 1
+
+        mocker(Color).mock("name", create=True).return_value("mocked").called_once()
+        # pylint: disable=comparison-with-callable
+        assert Color.name == "mocked"  # type: ignore
@@ -44,6 +44,11 @@ class StubbingTestCase:
         stub = mocker().mock("method.another_method").return_value("stubbed").self()
         assert stub.method().another_method() == "stubbed"  # type: ignore [attr-defined]
 
+    def test_stub_chaining_keeps_mocked_return_value(self) -> None:
+        stub = mocker().mock("another_method").return_value("stubbed").self()
+        stub.mock("method.another_method")
+        assert stub.method().another_method() == "stubbed"  # type: ignore [attr-defined]
+
     async def test_stub_async_method(self) -> None:
         stub = mocker(spec=SomeClass).mock("async_instance_method").return_value("stubbed").self()
         assert await stub.async_instance_method() == "stubbed"  # type: ignore [attr-defined]